@@ -0,0 +1,14 @@
+import pytest
+
+from swepin import SwePinStrict, PinFormat
+
+
+@pytest.fixture(scope="session")
+def canonical_pin() -> SwePinStrict:
+    """
+    One shared SwePinStrict("19801224-1231") instance for the tests that
+    only read its properties, so the same string is not re-validated and
+    re-parsed once per test. Tests exercising construction itself build
+    their own instances.
+    """
+    return SwePinStrict("19801224-1231", PinFormat.LONG_WITH_SEPARATOR)
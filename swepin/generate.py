@@ -4,6 +4,90 @@ from datetime import date
 from swepin.loose import SwePinLoose, calculate_luhn_validation_digit
 from swepin.strict import SwePinStrict, PinFormat
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the scalar path needs nothing extra.
+    np = None
+
+# Below this count the NumPy setup cost outweighs the vectorization win.
+_NUMPY_THRESHOLD = 1000
+
+# Days per month (1-indexed); February is resolved per year.
+_MONTH_LENGTHS = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _generate_pin_strings_numpy(
+    count: int,
+    start_year: int,
+    end_year: int,
+    include_coordination_numbers: bool,
+    male_ratio: float,
+    today: date,
+) -> list[str]:
+    """
+    Generate `count` valid PIN strings (YYYYMMDD-NNNN) with all random
+    fields drawn as arrays and the Luhn digit computed by broadcasting,
+    instead of one scalar random/Luhn call per pin. Candidates with birth
+    dates in the future are rejected, so generation loops until enough
+    survivors exist (oversampling each round to make a second round rare).
+    """
+    rng = np.random.default_rng()
+    month_lengths = np.array([0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])
+    luhn_weights = np.array([2, 1, 2, 1, 2, 1, 2, 1, 2])
+
+    pin_strs: list[str] = []
+    while len(pin_strs) < count:
+        n = int((count - len(pin_strs)) * 1.2) + 16
+
+        years = rng.integers(start_year, end_year + 1, size=n)
+        months = rng.integers(1, 13, size=n)
+        is_leap = (years % 400 == 0) | ((years % 4 == 0) & (years % 100 != 0))
+        max_days = np.where(
+            (months == 2) & is_leap, 29, month_lengths[months]
+        )
+        days = rng.integers(1, max_days + 1)
+
+        valid = (years < today.year) | (
+            (years == today.year)
+            & (
+                (months < today.month)
+                | ((months == today.month) & (days <= today.day))
+            )
+        )
+
+        if include_coordination_numbers:
+            is_coordination = rng.random(n) < 0.1
+        else:
+            is_coordination = np.zeros(n, dtype=bool)
+        display_days = days + 60 * is_coordination
+
+        is_male = rng.random(n) < male_ratio
+        birth_places = rng.integers(0, 100, size=n)
+        gender_digits = rng.integers(0, 5, size=n) * 2 + is_male
+
+        digits = np.empty((n, 9), dtype=np.int64)
+        short_years = years % 100
+        digits[:, 0] = short_years // 10
+        digits[:, 1] = short_years % 10
+        digits[:, 2] = months // 10
+        digits[:, 3] = months % 10
+        digits[:, 4] = display_days // 10
+        digits[:, 5] = display_days % 10
+        digits[:, 6] = birth_places // 10
+        digits[:, 7] = birth_places % 10
+        digits[:, 8] = gender_digits
+        weighted = digits * luhn_weights
+        weighted -= 9 * (weighted > 9)
+        validation_digits = (10 - weighted.sum(axis=1) % 10) % 10
+
+        for i in np.flatnonzero(valid)[: count - len(pin_strs)]:
+            pin_strs.append(
+                f"{years[i]}{months[i]:02d}{display_days[i]:02d}"
+                f"-{birth_places[i]:02d}{gender_digits[i]}{validation_digits[i]}"
+            )
+
+    return pin_strs
+
 
 def generate_valid_pins(
     count: int = 10,
@@ -37,37 +121,81 @@ def generate_valid_pins(
     pins: list[SwePinLoose | SwePinStrict] = []
     today_date = today if today else date.today()
 
+    if np is not None and count > _NUMPY_THRESHOLD:
+        for pin_str in _generate_pin_strings_numpy(
+            count=count,
+            start_year=start_year,
+            end_year=end_year,
+            include_coordination_numbers=include_coordination_numbers,
+            male_ratio=male_ratio,
+            today=today_date,
+        ):
+            if strict:
+                pins.append(
+                    SwePinStrict(
+                        pin_str,
+                        pin_format=PinFormat.LONG_WITH_SEPARATOR,
+                        today=today_date,
+                    )
+                )
+            else:
+                # YYYYMMDD-NNNN by construction; slice instead of re-parsing.
+                pins.append(
+                    SwePinLoose._fast_construct(
+                        century=pin_str[:2],
+                        year=pin_str[2:4],
+                        month=pin_str[4:6],
+                        day=pin_str[6:8],
+                        separator="-",
+                        birth_number=pin_str[9:12],
+                        validation_digit=pin_str[12],
+                        today=today_date,
+                    )
+                )
+
+    february_days = {
+        year: 29 if (year % 400 == 0 or (year % 4 == 0 and year % 100 != 0)) else 28
+        for year in range(start_year, end_year + 1)
+    }
+
+    # Pre-draw random fields in batches: one random.choices call per field
+    # per batch instead of 5+ randint/choice calls per iteration.
+    batch_size = max(count, 32)
+    draw_index = batch_size  # exhausted, so the first iteration draws a batch
+
     while len(pins) < count:
-        year = random.randint(start_year, end_year)
-        month = random.randint(1, 12)
+        if draw_index >= batch_size:
+            years = random.choices(range(start_year, end_year + 1), k=batch_size)
+            months = random.choices(range(1, 13), k=batch_size)
+            birth_places = random.choices(range(100), k=batch_size)
+            odd_gender_digits = random.choices((1, 3, 5, 7, 9), k=batch_size)
+            even_gender_digits = random.choices((0, 2, 4, 6, 8), k=batch_size)
+            rolls = [random.random() for _ in range(batch_size * 3)]
+            draw_index = 0
 
-        if month == 2:  # February
-            max_day = (
-                29 if (year % 400 == 0 or (year % 4 == 0 and year % 100 != 0)) else 28
-            )
-        elif month in [4, 6, 9, 11]:
-            max_day = 30
-        else:
-            max_day = 31
+        year = years[draw_index]
+        month = months[draw_index]
+
+        max_day = february_days[year] if month == 2 else _MONTH_LENGTHS[month]
+
+        day = 1 + int(rolls[draw_index * 3] * max_day)
 
-        day = random.randint(1, max_day)
+        is_coordination_number = (
+            rolls[draw_index * 3 + 1] < 0.1 and include_coordination_numbers
+        )
+        is_male = rolls[draw_index * 3 + 2] < male_ratio
+        birth_place = birth_places[draw_index]
+        gender_digit = (
+            odd_gender_digits[draw_index] if is_male else even_gender_digits[draw_index]
+        )
+        draw_index += 1
 
         pin_date = datetime.date(year, month, day)
         if pin_date > today_date:
             continue
 
-        is_coordination_number = random.random() < 0.1 and include_coordination_numbers
         display_day = day + 60 if is_coordination_number else day
 
-        is_male = random.random() < male_ratio
-
-        birth_place = random.randint(0, 99)
-        gender_digit = (
-            random.choice([1, 3, 5, 7, 9])
-            if is_male
-            else random.choice([0, 2, 4, 6, 8])
-        )
-
         year_str = str(year)
         short_year = year_str[-2:]
         month_str = f"{month:02d}"
@@ -86,9 +214,22 @@ def generate_valid_pins(
         pin_str = f"{pin_with_century}{separator}{birth_number_with_check}"
 
         if strict:
-            pin_obj = SwePinStrict(pin_str, pin_format=PinFormat.LONG_WITH_SEPARATOR)
+            pin_obj = SwePinStrict(
+                pin_str, pin_format=PinFormat.LONG_WITH_SEPARATOR, today=today_date
+            )
         else:
-            pin_obj = SwePinLoose(pin_str, today=today_date)
+            # The generator just computed every field, so re-parsing and
+            # re-checking Luhn on the formatted string is redundant work.
+            pin_obj = SwePinLoose._fast_construct(
+                century=year_str[:2],
+                year=short_year,
+                month=month_str,
+                day=day_str,
+                separator=separator,
+                birth_number=birth_number,
+                validation_digit=str(validation_digit),
+                today=today_date,
+            )
 
         pins.append(pin_obj)
 
@@ -96,6 +237,11 @@ def generate_valid_pins(
         return [pin.dict for pin in pins]
 
     if to_json:
-        return [pin.json for pin in pins]
+        json_strings: list[str] = []
+        for pin in pins:
+            buf: list[str] = []
+            pin._write_json(buf)
+            json_strings.append("".join(buf))
+        return json_strings
 
     return pins
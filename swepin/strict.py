@@ -14,6 +14,19 @@ class PinFormat(Enum):
     SHORT_WITH_SEPARATOR = auto()  # YYMMDD-NNNN (11 chars)
 
 
+_STRICT_PATTERNS: dict[PinFormat, re.Pattern] = {
+    PinFormat.LONG_WITH_SEPARATOR: re.compile(r"^(\d{4})(\d{2})(\d{2})-(\d{3})(\d{1})$"),
+    PinFormat.LONG_WITHOUT_SEPARATOR: re.compile(
+        r"^(\d{4})(\d{2})(\d{2})(\d{3})(\d{1})$"
+    ),
+    PinFormat.SHORT_WITH_SEPARATOR: re.compile(r"^(\d{2})(\d{2})(\d{2})-(\d{3})(\d{1})$"),
+}
+
+_LONG_WITH_SEPARATOR_PATTERN = re.compile(r"^(\d{4})(\d{2})(\d{2})[-+](\d{3})(\d{1})$")
+_LONG_WITHOUT_SEPARATOR_PATTERN = re.compile(r"^(\d{4})(\d{2})(\d{2})(\d{3})(\d{1})$")
+_SHORT_WITH_SEPARATOR_PATTERN = re.compile(r"^(\d{2})(\d{2})(\d{2})-(\d{3})(\d{1})$")
+
+
 class SwePinStrict(SwePinLoose):
     """
     A strict version of SwePinLoose that accepts specific PIN formats. See docstring of SwePinLoose.
@@ -27,16 +40,25 @@ class SwePinStrict(SwePinLoose):
     - LONG_WITH_SEPARATOR
     """
 
+    __slots__ = ("pin_format", "_strict_match")
+
     def __init__(
         self,
         pin: str,
         pin_format: PinFormat = PinFormat.LONG_WITH_SEPARATOR,
         today: Date | None = None,
     ):
-        if not isinstance(pin, str):
-            raise Exception("Swedish personal identity number must be a string")
-
-        if not self._validate_format(pin, pin_format):
+        # No isinstance pre-check: the match call below rejects non-strings
+        # itself, so the valid-pin path pays for one type check (in the base
+        # __init__) instead of two. fullmatch (not match with $, which allows
+        # a trailing newline) keeps the old explicit length check redundant.
+        try:
+            match = _STRICT_PATTERNS[pin_format].fullmatch(pin)
+        except TypeError:
+            raise Exception(
+                "Swedish personal identity number must be a string"
+            ) from None
+        if match is None:
             expected_format = self._get_format_description(pin_format)
             raise SwePinFormatError(
                 f"The pin in the request does not match required format {pin_format.name}. "
@@ -44,28 +66,9 @@ class SwePinStrict(SwePinLoose):
             )
 
         self.pin_format = pin_format
+        self._strict_match = match
         super().__init__(pin, today)
 
-    def _validate_format(self, pin: str, pin_format: PinFormat) -> bool:
-        """Validate PIN matches the specified format."""
-        patterns = {
-            PinFormat.LONG_WITH_SEPARATOR: (
-                r"^(\d{4})(\d{2})(\d{2})-(\d{3})(\d{1})$",
-                13,
-            ),
-            PinFormat.LONG_WITHOUT_SEPARATOR: (
-                r"^(\d{4})(\d{2})(\d{2})(\d{3})(\d{1})$",
-                12,
-            ),
-            PinFormat.SHORT_WITH_SEPARATOR: (
-                r"^(\d{2})(\d{2})(\d{2})-(\d{3})(\d{1})$",
-                11,
-            ),
-        }
-
-        pattern, expected_length = patterns[pin_format]
-        return len(pin) == expected_length and re.match(pattern, pin) is not None
-
     def _get_format_description(self, pin_format: PinFormat) -> str:
         """Get human-readable format description."""
         descriptions = {
@@ -77,14 +80,10 @@ class SwePinStrict(SwePinLoose):
 
     def _parse_pin_parts(self) -> None:
         """Override parent method to use strict parsing based on format."""
-        patterns = {
-            PinFormat.LONG_WITH_SEPARATOR: r"^(\d{4})(\d{2})(\d{2})-(\d{3})(\d{1})$",
-            PinFormat.LONG_WITHOUT_SEPARATOR: r"^(\d{4})(\d{2})(\d{2})(\d{3})(\d{1})$",
-            PinFormat.SHORT_WITH_SEPARATOR: r"^(\d{2})(\d{2})(\d{2})-(\d{3})(\d{1})$",
-        }
-
-        pattern = patterns[self.pin_format]
-        match = re.match(pattern, str(self.pin))
+        match = self._strict_match
+        # Drop the slot reference once parsing starts so the instance does
+        # not retain the re.Match (and its subject string) for its lifetime.
+        self._strict_match = None
 
         if self.pin_format in [
             PinFormat.LONG_WITH_SEPARATOR,
@@ -102,8 +101,9 @@ class SwePinStrict(SwePinLoose):
             birth_number = match.group(4)
             original_validation_digit = match.group(5)
 
-            # Derive century for short format
-            current_year = self.today.year if self.today else Date.today().year
+            # Derive century for short format; today is always set by the
+            # base __init__ before parsing, so no fallback call is needed.
+            current_year = self.today.year
             full_year = str(current_year - ((current_year - int(year_part)) % 100))
 
         day_int = int(day)
@@ -119,6 +119,10 @@ class SwePinStrict(SwePinLoose):
         self.birth_place = birth_number[:2]
         self.gender_digit = birth_number[2]
         self.is_coordination_number = is_coordination_number
+        self._day_int = day_int
+        self._month_int = int(month)
+        self._full_year_int = int(full_year)
+        self._birth_number_int = int(birth_number)
 
         calculated_validation_digit = str(
             calculate_luhn_validation_digit(
@@ -143,14 +147,14 @@ class SwePinStrict(SwePinLoose):
 
 def validate_long_with_separator(pin: str) -> bool:
     """Validate format: YYYYMMDD-XXXX or YYYYMMDD+XXXX (e.g., 19900615-1234, 19200615+1234)"""
-    return re.match(r"^(\d{4})(\d{2})(\d{2})[-+](\d{3})(\d{1})$", pin) is not None
+    return _LONG_WITH_SEPARATOR_PATTERN.match(pin) is not None
 
 
 def validate_long_without_separator(pin: str) -> bool:
     """Validate format: YYYYMMDDXXXX (e.g., 199006151234)"""
-    return re.match(r"^(\d{4})(\d{2})(\d{2})(\d{3})(\d{1})$", pin) is not None
+    return _LONG_WITHOUT_SEPARATOR_PATTERN.match(pin) is not None
 
 
 def validate_short_with_separator(pin: str) -> bool:
     """Validate format: YYMMDD-XXXX or YYMMDD+XXXX (e.g., 900615-1234)"""
-    return re.match(r"^(\d{2})(\d{2})(\d{2})-(\d{3})(\d{1})$", pin) is not None
+    return _SHORT_WITH_SEPARATOR_PATTERN.match(pin) is not None
@@ -1,8 +1,10 @@
+import json
+
 import pytest
 from datetime import date
 from swepin.loose import SwePinLoose
 from swepin.strict import SwePinStrict, PinFormat
-from swepin.generate import generate_valid_pins
+from swepin.generate import generate_valid_pins, np, _NUMPY_THRESHOLD
 
 
 def test_generate_default_pins():
@@ -34,6 +36,9 @@ def test_generate_pins_as_json():
     pins = generate_valid_pins(count=4, to_json=True)
     assert isinstance(pins, list)
     assert all(isinstance(pin, str) for pin in pins)  # Assuming `.json` returns string
+    for pin_json in pins:
+        parsed = json.loads(pin_json)
+        assert parsed == SwePinLoose(parsed["personal_identity_number"]).dict
 
 
 def test_include_coordination_numbers():
@@ -54,3 +59,12 @@ def test_gender_ratio_extremes_all_female():
     pins = generate_valid_pins(count=10, male_ratio=0.0)
     assert all(pin.female for pin in pins)
     assert all(not pin.male for pin in pins)
+
+
+@pytest.mark.skipif(np is None, reason="numpy not installed")
+def test_generate_bulk_numpy_path():
+    count = _NUMPY_THRESHOLD + 100
+    pins = generate_valid_pins(count=count, male_ratio=1.0)
+    assert len(pins) == count
+    assert all(isinstance(pin, SwePinLoose) for pin in pins)
+    assert all(pin.male for pin in pins)
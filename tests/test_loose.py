@@ -1,6 +1,7 @@
 import unittest
 from datetime import date
-from swepin.loose import SwePinLoose
+from swepin.loose import SwePinLoose, calculate_luhn_validation_digit
+from swepin.exceptions import SwePinLuhnError
 
 
 class TestSwedishPersonalIdentityNumber(unittest.TestCase):
@@ -88,9 +89,24 @@ class TestSwedishPersonalIdentityNumber(unittest.TestCase):
         valid_pin = SwePinLoose("198012241231")
         self.assertEqual(valid_pin.validation_digit, "1")
 
-        with self.assertRaises(Exception) as context:
+        with self.assertRaisesRegex(SwePinLuhnError, "Validation digit did not match"):
             SwePinLoose("198012241235")
-        self.assertIn("Validation digit did not match", str(context.exception))
+
+    def test_non_ascii_decimal_digits(self):
+        """Test that non-ASCII decimal digits parse and validate like ASCII ones."""
+        # 198012241231 written with Arabic-Indic digits
+        pin = SwePinLoose("١٩٨٠١٢٢٤١٢٣١")
+        self.assertEqual(pin.age, SwePinLoose("198012241231").age)
+
+        self.assertEqual(
+            calculate_luhn_validation_digit("٨٠١٢٢٤١٢٣"),
+            calculate_luhn_validation_digit("801224123"),
+        )
+
+    def test_luhn_non_digit_input(self):
+        """Test that non-digit input to the Luhn calculation raises ValueError."""
+        with self.assertRaises(ValueError):
+            calculate_luhn_validation_digit("abc123456")
 
     def test_invalid_inputs(self):
         """Test various invalid inputs."""
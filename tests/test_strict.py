@@ -1,14 +1,46 @@
+import json
+
 import pytest
 from datetime import date
-from swepin import SwePinStrict, PinFormat
+from swepin import SwePinLoose, SwePinStrict, PinFormat, SwePinFormatError, SwePinLuhnError
+from swepin.loose import calculate_luhn_validation_digit
+
+
+def _make_valid(pin_str: str, pin_format: PinFormat) -> str:
+    """Replace the last digit of pin_str with the correct Luhn digit."""
+    if pin_format in (PinFormat.LONG_WITH_SEPARATOR, PinFormat.LONG_WITHOUT_SEPARATOR):
+        base_digits = pin_str.replace("-", "")[2:-1]
+    else:
+        base_digits = pin_str.replace("-", "")[:-1]
+    return pin_str[:-1] + str(calculate_luhn_validation_digit(base_digits))
+
+
+# Luhn-corrected once at import instead of inside every test run.
+_VALID_YEAR_PINS: tuple[tuple[str, PinFormat], ...] = tuple(
+    (_make_valid(pin_str, pin_format), pin_format)
+    for pin_str, pin_format in (
+        ("20001201-1231", PinFormat.LONG_WITH_SEPARATOR),
+        ("19501015-5678", PinFormat.LONG_WITH_SEPARATOR),
+        ("200012011231", PinFormat.LONG_WITHOUT_SEPARATOR),
+        ("001201-1231", PinFormat.SHORT_WITH_SEPARATOR),
+    )
+)
+
+# Coordination-number pins (day = real day + 60), one per day band.
+_COORD_PINS: dict[str, str] = {
+    day: _make_valid(f"198012{day}-1230", PinFormat.LONG_WITH_SEPARATOR)
+    for day in ("61", "75", "84", "91")
+}
+
+_LEAP_PIN: str = _make_valid("19800229-1230", PinFormat.LONG_WITH_SEPARATOR)
 
 
 class TestSwePinStrictValidFormats:
     """Test cases for valid SwePinStrict formats."""
 
-    def test_valid_format_regular_number_long_with_separator(self):
+    def test_valid_format_regular_number_long_with_separator(self, canonical_pin):
         """Test valid regular personal number in long format with separator."""
-        pin = SwePinStrict("19801224-1231", PinFormat.LONG_WITH_SEPARATOR)
+        pin = canonical_pin
         assert pin.pin == "19801224-1231"
         assert pin.century == "19"
         assert pin.year == "80"
@@ -33,52 +65,40 @@ class TestSwePinStrictValidFormats:
         assert pin.year == "80"
         assert pin.separator == "-"
 
-    def test_valid_format_coordination_number(self):
-        """Test valid coordination number in all formats."""
-        # Long with separator
-        pin1 = SwePinStrict("19801284-1238", PinFormat.LONG_WITH_SEPARATOR)
-        assert pin1.day == "84"
-        assert pin1.is_coordination_number
-        assert pin1.calculated_day_from_coordination_number == "24"
-
-        # Long without separator
-        pin2 = SwePinStrict("198012841238", PinFormat.LONG_WITHOUT_SEPARATOR)
-        assert pin2.is_coordination_number
-
-        # Short with separator
-        pin3 = SwePinStrict("801284-1238", PinFormat.SHORT_WITH_SEPARATOR)
-        assert pin3.is_coordination_number
+    @pytest.mark.parametrize("coordination_day", sorted(_COORD_PINS))
+    def test_valid_format_coordination_number(self, coordination_day):
+        """Test valid coordination numbers across the day bands."""
+        pin = SwePinStrict(
+            _COORD_PINS[coordination_day], PinFormat.LONG_WITH_SEPARATOR
+        )
+        assert pin.day == coordination_day
+        assert pin.is_coordination_number
+        assert (
+            int(pin.calculated_day_from_coordination_number)
+            == int(coordination_day) - 60
+        )
 
-    def test_valid_format_different_years(self):
+    @pytest.mark.parametrize(
+        "coord_pin, pin_format",
+        [
+            ("19801284-1238", PinFormat.LONG_WITH_SEPARATOR),
+            ("198012841238", PinFormat.LONG_WITHOUT_SEPARATOR),
+            ("801284-1238", PinFormat.SHORT_WITH_SEPARATOR),
+        ],
+    )
+    def test_coordination_number_each_format(self, coord_pin, pin_format):
+        """Coordination numbers parse in every strict format."""
+        assert SwePinStrict(coord_pin, pin_format).is_coordination_number
+
+    @pytest.mark.parametrize("valid_pin, pin_format", _VALID_YEAR_PINS)
+    def test_valid_format_different_years(self, valid_pin, pin_format):
         """Test valid format with different years."""
-        valid_test_cases: list[tuple[str, PinFormat]] = [
-            ("20001201-1231", PinFormat.LONG_WITH_SEPARATOR),
-            ("19501015-5678", PinFormat.LONG_WITH_SEPARATOR),
-            ("200012011231", PinFormat.LONG_WITHOUT_SEPARATOR),
-            ("001201-1231", PinFormat.SHORT_WITH_SEPARATOR),
-        ]
-
-        # Test valid historical dates
-        for pin_str, pin_format in valid_test_cases:
-            from swepin.loose import calculate_luhn_validation_digit
-
-            if pin_format in [
-                PinFormat.LONG_WITH_SEPARATOR,
-                PinFormat.LONG_WITHOUT_SEPARATOR,
-            ]:
-                base_digits: str = pin_str.replace("-", "")[2:-1]
-            else:
-                base_digits: str = pin_str.replace("-", "")[:-1]
-
-            correct_digit: int = calculate_luhn_validation_digit(base_digits)
-            valid_pin: str = pin_str[:-1] + str(correct_digit)
-
-            pin = SwePinStrict(valid_pin, pin_format)
-            assert pin.pin == valid_pin
+        pin = SwePinStrict(valid_pin, pin_format)
+        assert pin.pin == valid_pin
 
-    def test_inherited_functionality(self):
+    def test_inherited_functionality(self, canonical_pin):
         """Test that all inherited functionality works correctly."""
-        pin = SwePinStrict("19801224-1231", PinFormat.LONG_WITH_SEPARATOR)
+        pin = canonical_pin
 
         # Test properties
         assert isinstance(pin.birth_date, date)
@@ -98,24 +118,24 @@ class TestSwePinStrictInvalidFormats:
     def test_reject_wrong_format_for_enum(self):
         """Test rejection when PIN doesn't match specified format."""
         # Long format PIN with short format enum
-        with pytest.raises(Exception, match="does not match required format"):
+        with pytest.raises(SwePinFormatError, match="does not match required format"):
             SwePinStrict("19801224-1231", PinFormat.SHORT_WITH_SEPARATOR)
 
         # Short format PIN with long format enum
-        with pytest.raises(Exception, match="does not match required format"):
+        with pytest.raises(SwePinFormatError, match="does not match required format"):
             SwePinStrict("801224-1231", PinFormat.LONG_WITH_SEPARATOR)
 
         # With separator PIN using without separator enum
-        with pytest.raises(Exception, match="does not match required format"):
+        with pytest.raises(SwePinFormatError, match="does not match required format"):
             SwePinStrict("19801224-1231", PinFormat.LONG_WITHOUT_SEPARATOR)
 
         # Without separator PIN using with separator enum
-        with pytest.raises(Exception, match="does not match required format"):
+        with pytest.raises(SwePinFormatError, match="does not match required format"):
             SwePinStrict("198012241231", PinFormat.LONG_WITH_SEPARATOR)
 
-    def test_reject_wrong_length(self):
-        """Test rejection of wrong length strings for each format."""
-        test_cases: list[tuple[str, PinFormat]] = [
+    @pytest.mark.parametrize(
+        "invalid_pin, pin_format",
+        [
             ("1980122-1231", PinFormat.LONG_WITH_SEPARATOR),  # Too short
             (
                 "198012241-1231",
@@ -132,25 +152,27 @@ class TestSwePinStrictInvalidFormats:
                 "8012241-1231",
                 PinFormat.SHORT_WITH_SEPARATOR,
             ),  # Too long before separator
-        ]
-
-        for invalid_pin, pin_format in test_cases:
-            with pytest.raises(Exception, match="does not match required format"):
-                SwePinStrict(invalid_pin, pin_format)
+        ],
+    )
+    def test_reject_wrong_length(self, invalid_pin, pin_format):
+        """Test rejection of wrong length strings for each format."""
+        with pytest.raises(SwePinFormatError, match="does not match required format"):
+            SwePinStrict(invalid_pin, pin_format)
 
-    def test_reject_non_numeric_parts(self):
-        """Test rejection of non-numeric parts."""
-        test_cases: list[tuple[str, PinFormat]] = [
+    @pytest.mark.parametrize(
+        "invalid_pin, pin_format",
+        [
             ("ABCD1224-1231", PinFormat.LONG_WITH_SEPARATOR),
             ("198O1224-1231", PinFormat.LONG_WITH_SEPARATOR),
             ("19801224-ABCD", PinFormat.LONG_WITH_SEPARATOR),
             ("ABCD12241231", PinFormat.LONG_WITHOUT_SEPARATOR),
             ("AB1224-1231", PinFormat.SHORT_WITH_SEPARATOR),
-        ]
-
-        for invalid_pin, pin_format in test_cases:
-            with pytest.raises(Exception, match="does not match required format"):
-                SwePinStrict(invalid_pin, pin_format)
+        ],
+    )
+    def test_reject_non_numeric_parts(self, invalid_pin, pin_format):
+        """Test rejection of non-numeric parts."""
+        with pytest.raises(SwePinFormatError, match="does not match required format"):
+            SwePinStrict(invalid_pin, pin_format)
 
     def test_reject_non_string_input(self):
         """Test rejection of non-string input."""
@@ -159,30 +181,26 @@ class TestSwePinStrictInvalidFormats:
         ):
             SwePinStrict(198012241234, PinFormat.LONG_WITHOUT_SEPARATOR)
 
-    def test_reject_invalid_luhn_validation(self):
-        """Test rejection of invalid Luhn validation digit."""
-        test_cases: list[tuple[str, PinFormat]] = [
+    @pytest.mark.parametrize(
+        "invalid_pin, pin_format",
+        [
             ("19801224-1235", PinFormat.LONG_WITH_SEPARATOR),
             ("198012241235", PinFormat.LONG_WITHOUT_SEPARATOR),
             ("801224-1235", PinFormat.SHORT_WITH_SEPARATOR),
-        ]
-
-        for invalid_pin, pin_format in test_cases:
-            with pytest.raises(Exception, match="Validation digit did not match"):
-                SwePinStrict(invalid_pin, pin_format)
+        ],
+    )
+    def test_reject_invalid_luhn_validation(self, invalid_pin, pin_format):
+        """Test rejection of invalid Luhn validation digit."""
+        with pytest.raises(SwePinLuhnError, match="Validation digit did not match"):
+            SwePinStrict(invalid_pin, pin_format)
 
 
 class TestSwePinStrictEdgeCases:
     """Test edge cases for SwePinStrict."""
 
     def test_coordination_number_luhn_validation(self):
-        from swepin.loose import calculate_luhn_validation_digit
-
         # Valid coordination number (day 84 = 24 + 60)
-        base_digits: str = "801284123"
-        correct_digit: int = calculate_luhn_validation_digit(base_digits)
-
-        valid_coord_pin: str = f"19801284-123{correct_digit}"
+        valid_coord_pin = _COORD_PINS["84"]
 
         # Should not raise exception
         pin = SwePinStrict(valid_coord_pin, PinFormat.LONG_WITH_SEPARATOR)
@@ -191,21 +209,15 @@ class TestSwePinStrictEdgeCases:
         assert pin.calculated_day_from_coordination_number == "24"
 
         # Invalid validation digit
-        wrong_digit: int = (correct_digit + 1) % 10
-        invalid_coord_pin: str = f"19801284-123{wrong_digit}"
+        wrong_digit: int = (int(valid_coord_pin[-1]) + 1) % 10
+        invalid_coord_pin: str = valid_coord_pin[:-1] + str(wrong_digit)
 
-        with pytest.raises(Exception, match="Validation digit did not match"):
+        with pytest.raises(SwePinLuhnError, match="Validation digit did not match"):
             SwePinStrict(invalid_coord_pin, PinFormat.LONG_WITH_SEPARATOR)
 
     def test_leap_year_dates(self):
         """Test leap year dates in strict format."""
-        from swepin.loose import calculate_luhn_validation_digit
-
-        base_digits = "80022912"
-        validation_digit = calculate_luhn_validation_digit(base_digits + "3")
-        pin_str = f"19800229-123{validation_digit}"
-
-        pin = SwePinStrict(pin_str, PinFormat.LONG_WITH_SEPARATOR)
+        pin = SwePinStrict(_LEAP_PIN, PinFormat.LONG_WITH_SEPARATOR)
         assert pin.birth_date == date(1980, 2, 29)
 
     def test_custom_reference_date(self):
@@ -221,8 +233,6 @@ class TestSwePinStrictEdgeCases:
 
     def test_all_format_combinations(self):
         """Test that all format combinations work with same PIN data."""
-        from swepin.loose import calculate_luhn_validation_digit
-
         base_digits = "8012241"
         correct_digit = calculate_luhn_validation_digit(base_digits + "23")
 
@@ -245,32 +255,50 @@ class TestSwePinStrictEdgeCases:
 class TestSwePinStrictFormatProperties:
     """Test format property consistency in SwePinStrict."""
 
-    def test_format_consistency(self):
+    def test_format_consistency(self, canonical_pin):
         """Test that all format properties are consistent."""
-        pin = SwePinStrict("19801224-1231", PinFormat.LONG_WITH_SEPARATOR)
+        pin = canonical_pin
 
         assert pin.long_with_separator == "19801224-1231"
         assert len(pin.long_without_separator) == 12
         assert len(pin.short_with_separator) == 11
 
-    def test_separator_property_matches_format(self):
+    def test_separator_property_matches_format(self, canonical_pin):
         """Test that separator property matches the format used."""
-        pin_with_sep = SwePinStrict("19801224-1231", PinFormat.LONG_WITH_SEPARATOR)
-        assert pin_with_sep.separator == "-"
+        assert canonical_pin.separator == "-"
 
         pin_without_sep = SwePinStrict("198012241231", PinFormat.LONG_WITHOUT_SEPARATOR)
         assert not pin_without_sep.separator
 
-    def test_json_output(self):
+    def test_json_output(self, canonical_pin):
         """Test JSON output for SwePinStrict."""
-        pin = SwePinStrict("19801224-1231", PinFormat.LONG_WITH_SEPARATOR)
-
-        import json
+        pin = canonical_pin
 
         json_data = json.loads(pin.json)
         assert "personal_identity_number" in json_data
         assert json_data["personal_identity_number"] == "19801224-1231"
 
 
+class TestSwePinStrictVsLoose:
+    """Formats the loose parser accepts but strict mode must reject."""
+
+    _FLEXIBLE_PINS = (
+        "8012241231",  # 10 digits, no separator
+        "198012241231",  # 12 digits, no separator
+        "801224-1231",  # short with separator
+    )
+
+    @pytest.mark.parametrize("pin_str", _FLEXIBLE_PINS)
+    def test_loose_accepts_flexible_format(self, pin_str):
+        """The loose parser handles every flexible format."""
+        assert SwePinLoose(pin_str).birth_number == "123"
+
+    @pytest.mark.parametrize("pin_str", _FLEXIBLE_PINS)
+    def test_strict_rejects_flexible_format(self, pin_str):
+        """Strict LONG_WITH_SEPARATOR rejects every other format."""
+        with pytest.raises(SwePinFormatError, match="does not match required format"):
+            SwePinStrict(pin_str, PinFormat.LONG_WITH_SEPARATOR)
+
+
 if __name__ == "__main__":
     pytest.main([__file__])